@@ -1,2 +1,6 @@
 from .checkpoints import CheckpointAssessment
-from .workers import WorkerAssessment
\ No newline at end of file
+from .workers import WorkerAssessment
+from .results import CheckResult
+from .runner import Assessment, AssessmentRunner
+from .settings import SettingsCache
+from .provider import ConnectionProvider
@@ -1,126 +1,154 @@
-import pandas as pd
-from tabulate import tabulate
-from pathlib import Path
-from enums.storage_type import StorageType
-from enums.deployment_type import DeploymentType
+from enums import CheckStatus, Priority
+from .results import CheckResult
+from .provider import warn_deprecated_connection
+from .runner import Assessment, AssessmentRunner
 
-class CheckpointAssessment:
+# Multipliers converting pg_settings time units to minutes
+_UNIT_TO_MIN = {'ms': 1 / 60000, 's': 1 / 60, 'min': 1.0, 'h': 60.0, 'd': 1440.0}
+
+# Fixed checkpoint results, shared by every run since CheckResult is frozen
+_CHECKPOINT_TIMEOUT_SKIPPED = CheckResult(
+    parameter="checkpoint_timeout",
+    check_result=CheckStatus.SKIPPED,
+    priority=Priority.MEDIUM,
+    notes="No RTO specified"
+)
+_CHECKPOINT_TIMEOUT_PASSED = CheckResult(
+    parameter="checkpoint_timeout",
+    check_result=CheckStatus.PASSED,
+    priority=Priority.LOW,
+    notes="Within acceptable range for RTO"
+)
+_BGWRITER_LRU_MAXPAGES_FAILED = CheckResult(
+    parameter="bgwriter_lru_maxpages",
+    check_result=CheckStatus.FAILED,
+    priority=Priority.MEDIUM,
+    notes="Consider increasing bgwriter_lru_maxpages to reduce checkpoint I/O spikes."
+)
+_BGWRITER_LRU_MAXPAGES_PASSED = CheckResult(
+    parameter="bgwriter_lru_maxpages",
+    check_result=CheckStatus.PASSED,
+    priority=Priority.LOW,
+    notes="bgwriter_lru_maxpages is properly configured."
+)
+_MAX_WAL_SIZE_FAILED = CheckResult(
+    parameter="max_wal_size",
+    check_result=CheckStatus.FAILED,
+    priority=Priority.HIGH,
+    notes="Consider increasing max_wal_size to reduce checkpoint frequency and I/O spikes."
+)
+_MAX_WAL_SIZE_PASSED = CheckResult(
+    parameter="max_wal_size",
+    check_result=CheckStatus.PASSED,
+    priority=Priority.LOW,
+    notes="max_wal_size is properly configured."
+)
+_CHECKPOINT_TIMEOUT_FAILED_NOTES = "Exceeds RTO ({timeout:.1f}min > {rto}min). Reduce to meet recovery objectives.".format
+
+class CheckpointAssessment(Assessment):
     """
     A class to assess PostgreSQL checkpoint configurations.
     """
+    SETTINGS = ['checkpoint_timeout']
+    ERROR_PARAMETER = "checkpoints"
     
     def __init__(self, connection, desired_rto_in_minutes):
         """
         Initialize the CheckpointAssessment with a database connection.
 
         Args:
-            connection: A psycopg2 connection object
+            connection: A ConnectionProvider, or a psycopg connection (deprecated)
         """
+        warn_deprecated_connection(connection)
         self.connection = connection
         self.desired_rto_in_minutes = desired_rto_in_minutes
 
-    def _get_maxwritten_clean_stats(self):
+    def _get_maxwritten_clean_stats(self, cursor):
         """
         Get checkpoint statistics from the database.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(""" SELECT maxwritten_clean from pg_stat_bgwriter;""")
-        max_written_stat = cursor.fetchall()
-        cursor.close()
-        return max_written_stat[0][0]
-    def _get_checkpoint_stats(self):
+        return cursor.fetchone()[0]
+    def _get_checkpoint_stats(self, cursor):
         """
         Get checkpoint statistics from the database.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(""" SELECT num_timed, num_requested from pg_stat_checkpointer;""")
-        stats = cursor.fetchall() 
-        cursor.close()
-        return stats
-    def _get_checkpoint_timeout(self):
+        return cursor.fetchone()
+    def _get_checkpoint_timeout(self, settings):
         """
-        Checks if checkpoint_timeout is properly configured based on desired RTO.
-        Warns if checkpoint_timeout is greater than desired RTO.
+        Returns checkpoint_timeout in minutes, to be compared with the desired RTO.
+        Units other than the ones listed in _UNIT_TO_MIN are treated as seconds.
+
+        Args:
+            settings (SettingsCache): Settings of the assessed server
         
         Returns:
-            list: List containing checkpoint_timeout assessment
+            float: checkpoint_timeout in minutes
         """
+        timeout, unit = settings['checkpoint_timeout']
+        return timeout * _UNIT_TO_MIN.get(unit, 1 / 60)
 
-        with self.connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT setting, unit 
-                FROM pg_settings 
-                WHERE name = 'checkpoint_timeout';
-            """)
-            
-            setting, unit = cursor.fetchone()
-            timeout_seconds = int(setting)
-            
-            if unit == 's':
-                timeout_minutes = timeout_seconds / 60
-                return timeout_minutes
-            elif unit == 'min':
-                timeout_minutes = timeout_seconds
-                return timeout_minutes
-            else:
-                return None
+    def required_settings(self):
+        """
+        Returns the pg_settings parameters consume() reads. checkpoint_timeout is
+        only compared against an RTO, so nothing is needed without one.
 
-                
-    def prepare_checkpoint_stats(self):
+        Returns:
+            list: Names of the parameters
         """
-        Prepare checkpoint statistics for display.
+        if self.desired_rto_in_minutes is None:
+            return []
+        return self.SETTINGS
+
+    def queries(self):
+        """
+        Returns the queries needed by this assessment, in the order consume() expects them.
+
+        Returns:
+            list: List of (query, params) tuples
         """
+        return [
+            (""" SELECT maxwritten_clean from pg_stat_bgwriter;""", None),
+            (""" SELECT num_timed, num_requested from pg_stat_checkpointer;""", None)
+        ]
+
+    def consume(self, results, settings):
+        """
+        Builds the checkpoint assessment from the executed queries.
+
+        Args:
+            results: Cursors holding the results of queries(), in the same order
+            settings (SettingsCache): Settings of the assessed server
+
+        Returns:
+            list: List containing checkpoint assessments
+        """
+        bgwriter_cursor, checkpoint_cursor = results
         all_results=[]
-        checkpoint_stats = self._get_checkpoint_stats()
-        bgwriter_stats=self._get_maxwritten_clean_stats()
-        checkpoint_timeout = self._get_checkpoint_timeout()
+        checkpoint_stats = self._get_checkpoint_stats(checkpoint_cursor)
+        bgwriter_stats=self._get_maxwritten_clean_stats(bgwriter_cursor)
         if self.desired_rto_in_minutes is None:
-            all_results.append [{
-                "parameter": "checkpoint_timeout",
-                "check_result": "SKIPPED",
-                "priority": "MEDIUM",
-                "notes": "No RTO specified"
-            }]
-        if checkpoint_timeout > self.desired_rto_in_minutes:
-            all_results.append({
-                "parameter": "checkpoint_timeout",
-                "check_result": "FAILED",
-                "priority": "MEDIUM",
-                "notes": f"Exceeds RTO ({checkpoint_timeout:.1f}min > {self.desired_rto_in_minutes}min). Reduce to meet recovery objectives."
-            })
+            all_results.append(_CHECKPOINT_TIMEOUT_SKIPPED)
+        elif (checkpoint_timeout := self._get_checkpoint_timeout(settings)) > self.desired_rto_in_minutes:
+            all_results.append(CheckResult(
+                parameter="checkpoint_timeout",
+                check_result=CheckStatus.FAILED,
+                priority=Priority.MEDIUM,
+                notes=_CHECKPOINT_TIMEOUT_FAILED_NOTES(timeout=checkpoint_timeout, rto=self.desired_rto_in_minutes)
+            ))
         else:
-            all_results.append({
-                "parameter": "checkpoint_timeout",
-                "check_result": "PASSED",
-                "priority": "LOW",
-                "notes": "Within acceptable range for RTO"
-            })
+            all_results.append(_CHECKPOINT_TIMEOUT_PASSED)
         if bgwriter_stats > 0:
-                all_results.append({
-                "parameter": "bgwriter_lru_maxpages",
-                "check_result": "FAILED",
-                "priority": "MEDIUM",
-                "notes": f"Consider increasing bgwriter_lru_maxpages to reduce checkpoint I/O spikes."
-            })
+            all_results.append(_BGWRITER_LRU_MAXPAGES_FAILED)
         else:
-            all_results.append({
-                "parameter": "bgwriter_lru_maxpages",
-                "check_result": "PASSED",
-                "priority": "LOW",
-                "notes": "bgwriter_lru_maxpages is properly configured."
-            })
-        if checkpoint_stats[0][0] < checkpoint_stats[0][1]:
-            all_results.append({
-                "parameter": "max_wal_size",
-                "check_result": "FAILED",
-                "priority": "HIGH",
-                "notes": "Consider increasing max_wal_size to reduce checkpoint frequency and I/O spikes."
-            })
+            all_results.append(_BGWRITER_LRU_MAXPAGES_PASSED)
+        if checkpoint_stats[0] < checkpoint_stats[1]:
+            all_results.append(_MAX_WAL_SIZE_FAILED)
         else:
-            all_results.append({
-                "parameter": "max_wal_size",
-                "check_result": "PASSED",
-                "priority": "LOW",
-                "notes": "max_wal_size is properly configured."
-            })            
+            all_results.append(_MAX_WAL_SIZE_PASSED)
         return all_results
+
+    def prepare_checkpoint_stats(self):
+        """
+        Prepare checkpoint statistics for display.
+        """
+        return AssessmentRunner(self.connection, [self]).run()
@@ -1,175 +1,185 @@
-import pandas as pd
-import psycopg2
+from enums import CheckStatus, Priority
+from .results import CheckResult
+from .provider import warn_deprecated_connection
+from .runner import Assessment, AssessmentRunner
+
+# Results of the monitoring checks that do not depend on the setting value
+_TRACK_IO_TIMING_FAILED = CheckResult(
+    parameter='track_io_timing',
+    check_result=CheckStatus.FAILED,
+    priority=Priority.LOW,
+    notes=(
+        "track_io_timing is disabled. Enabling this setting allows for "
+        "measuring I/O timings which is useful for performance diagnostics."
+    )
+)
+_TRACK_IO_TIMING_PASSED = CheckResult(
+    parameter='track_io_timing',
+    check_result=CheckStatus.PASSED,
+    priority=Priority.LOW,
+    notes="track_io_timing is enabled, which allows for measuring I/O timings."
+)
+_TRACK_WAL_IO_TIMING_FAILED = CheckResult(
+    parameter='track_wal_io_timing',
+    check_result=CheckStatus.FAILED,
+    priority=Priority.LOW,
+    notes=(
+        "track_wal_io_timing is disabled. Enabling this setting allows for "
+        "measuring WAL I/O timings which can help diagnose WAL-related performance issues."
+    )
+)
+_TRACK_WAL_IO_TIMING_PASSED = CheckResult(
+    parameter='track_wal_io_timing',
+    check_result=CheckStatus.PASSED,
+    priority=Priority.LOW,
+    notes="track_wal_io_timing is enabled, which allows for measuring WAL I/O timings."
+)
+_TRACK_COMMIT_TIMESTAMP_FAILED = CheckResult(
+    parameter="track_commit_timestamp",
+    check_result=CheckStatus.FAILED,
+    priority=Priority.LOW,
+    notes=(
+        "track_commit_timestamp is disabled. Enabling this setting allows tracking "
+        "transaction commit timestamps, which is useful for replication and temporal queries."
+    )
+)
+_TRACK_COMMIT_TIMESTAMP_PASSED = CheckResult(
+    parameter="track_commit_timestamp",
+    check_result=CheckStatus.PASSED,
+    priority=Priority.LOW,
+    notes="track_commit_timestamp is enabled, which allows tracking of transaction commit timestamps."
+)
+_LOG_LOCK_WAITS_FAILED = CheckResult(
+    parameter='log_lock_waits',
+    check_result=CheckStatus.FAILED,
+    priority=Priority.LOW,
+    notes="log_lock_waits is disabled. Enabling this setting allows logging of lock wait events, which can help diagnose lock contention issues."
+)
+_LOG_LOCK_WAITS_PASSED = CheckResult(
+    parameter='log_lock_waits',
+    check_result=CheckStatus.PASSED,
+    priority=Priority.LOW,
+    notes="log_lock_waits is enabled, which allows logging of lock wait events."
+)
+_LOG_TEMP_FILES_FAILED = CheckResult(
+    parameter="log_temp_files",
+    check_result=CheckStatus.FAILED,
+    priority=Priority.LOW,
+    notes=(
+        "log_temp_files is disabled (-1). Setting this to a value (in KB) will log the use of "
+        "temporary files larger than that threshold, which helps identify queries that might "
+        "benefit from more work_mem allocation."
+    )
+)
+_LOG_TEMP_FILES_PASSED_NOTES = (
+    "log_temp_files is set to {threshold}KB, which logs usage of temporary files "
+    "larger than this threshold to help identify inefficient queries."
+).format
+
+class ObservabilityAssessment(Assessment):
+    SETTINGS = [
+        'track_io_timing',
+        'track_wal_io_timing',
+        'track_commit_timestamp',
+        'log_lock_waits',
+        'log_temp_files'
+    ]
+    ERROR_PARAMETER = "observability"
 
-class ObservabilityAssessment:
     def __init__(self, connection):
         """
         Initialize the Observability assessment with a database connection.
 
         Args:
-            connection: A psycopg2 connection object
+            connection: A ConnectionProvider, or a psycopg connection (deprecated)
         """
+        warn_deprecated_connection(connection)
         self.connection = connection
-    
+        self._settings = {}
+
     def _get_track_io_timing(self):
         """
         Check if track_io_timing is enabled.
         
         Returns:
-            dict: A dictionary containing the assessment result with keys:
-                - 'result': The current track_io_timing setting
-                - 'check_result': 'warning' if track_io_timing is off, 'pass' otherwise
-                - 'priority': 'low' indicating this is a low priority setting
-                - 'notes': Description of the finding
-        """
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT setting FROM pg_settings WHERE name = 'track_io_timing';")
-        setting_value = cursor.fetchone()[0]  # Extract the value from the tuple
-        
-        assessment = {
-            'parameter': 'track_io_timing',
-            'check_result': 'FAILED' if setting_value == 'off' else 'PASSED',
-            'priority': 'LOW',
-            'notes': (
-                "track_io_timing is disabled. Enabling this setting allows for "
-                "measuring I/O timings which is useful for performance diagnostics."
-                if setting_value == 'off' else
-                "track_io_timing is enabled, which allows for measuring I/O timings."
-            )
-        }
-        
-        return assessment
+            CheckResult: The track_io_timing assessment
+        """
+        setting_value = self._settings['track_io_timing']
+        return _TRACK_IO_TIMING_FAILED if setting_value == 'off' else _TRACK_IO_TIMING_PASSED
         
     def _get_track_wal_io_timing(self):
         """
         Check if track_wal_io_timing is enabled.
         
         Returns:
-            dict: A dictionary containing the assessment result with keys:
-                - 'result': The current track_wal_io_timing setting
-                - 'check_result': 'warning' if track_wal_io_timing is off, 'pass' otherwise
-                - 'priority': 'low' indicating this is a low priority setting
-                - 'notes': Description of the finding
-        """
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT setting FROM pg_settings WHERE name = 'track_wal_io_timing';")
-        setting_value = cursor.fetchone()[0]  # Extract the value from the tuple
-        
-        assessment = {
-            'parameter': 'track_wal_io_timing',
-            'check_result': 'FAILED' if setting_value == 'off' else 'PASSED',
-            'priority': 'LOW',
-            'notes': (
-                "track_wal_io_timing is disabled. Enabling this setting allows for "
-                "measuring WAL I/O timings which can help diagnose WAL-related performance issues."
-                if setting_value == 'off' else
-                "track_wal_io_timing is enabled, which allows for measuring WAL I/O timings."
-            )
-        }
-        
-        return assessment
+            CheckResult: The track_wal_io_timing assessment
+        """
+        setting_value = self._settings['track_wal_io_timing']
+        return _TRACK_WAL_IO_TIMING_FAILED if setting_value == 'off' else _TRACK_WAL_IO_TIMING_PASSED
         
     def _get_track_commit_timestamp(self):
         """
         Check if track_commit_timestamp is enabled.
         
         Returns:
-            dict: A dictionary containing the assessment result with keys:
-                - 'result': The current track_commit_timestamp setting
-                - 'check_result': 'warning' if track_commit_timestamp is off, 'pass' otherwise
-                - 'priority': 'low' indicating this is a low priority setting
-                - 'notes': Description of the finding
-        """
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT setting FROM pg_settings WHERE name = 'track_commit_timestamp';")
-        setting_value = cursor.fetchone()[0]  # Extract the value from the tuple
-        
-        assessment = {
-            'parameter': "track_commit_timestamp",
-            'check_result': 'FAILED' if setting_value == 'off' else 'PASSED',
-            'priority': 'LOW',
-            'notes': (
-                "track_commit_timestamp is disabled. Enabling this setting allows tracking "
-                "transaction commit timestamps, which is useful for replication and temporal queries."
-                if setting_value == 'off' else
-                "track_commit_timestamp is enabled, which allows tracking of transaction commit timestamps."
-            )
-        }
-        
-        return assessment
+            CheckResult: The track_commit_timestamp assessment
+        """
+        setting_value = self._settings['track_commit_timestamp']
+        return _TRACK_COMMIT_TIMESTAMP_FAILED if setting_value == 'off' else _TRACK_COMMIT_TIMESTAMP_PASSED
         
     def _get_log_lock_waits(self):
         """
         Check if log_lock_waits is enabled.
         
         Returns:
-            dict: A dictionary containing the assessment result with keys:"""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT setting FROM pg_settings WHERE name = 'log_lock_waits';")
-        setting_value = cursor.fetchone()[0]  # Extract the value from the tuple
-        
-        assessment = {
-            'parameter': 'log_lock_waits',
-            'check_result': 'FAILED' if setting_value == 'off' else 'PASSED',
-            'priority': 'LOW',
-            'notes': (
-                "log_lock_waits is disabled. Enabling this setting allows logging of lock wait events, which can help diagnose lock contention issues."
-                if setting_value == 'off' else
-                "log_lock_waits is enabled, which allows logging of lock wait events."
-            )
-        }   
-        return assessment
+            CheckResult: The log_lock_waits assessment
+        """
+        setting_value = self._settings['log_lock_waits']
+        return _LOG_LOCK_WAITS_FAILED if setting_value == 'off' else _LOG_LOCK_WAITS_PASSED
         
     def _get_log_temp_files(self):
         """
         Check if log_temp_files is properly configured.
         
         Returns:
-            dict: A dictionary containing the assessment result with keys:
-                - 'result': The current log_temp_files setting
-                - 'check_result': 'warning' if log_temp_files is -1, 'pass' otherwise
-                - 'priority': 'low' indicating this is a low priority setting
-                - 'notes': Description of the finding
-        """
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT setting FROM pg_settings WHERE name = 'log_temp_files';")
-        setting_value = cursor.fetchone()[0]  # Extract the value from the tuple
-        
-        assessment = {
-            'parameter': "log_temp_files",
-            'check_result': 'FAILED' if setting_value == '-1' else 'PASSED',
-            'priority': 'LOW',
-            'notes': (
-                "log_temp_files is disabled (-1). Setting this to a value (in KB) will log the use of "
-                "temporary files larger than that threshold, which helps identify queries that might "
-                "benefit from more work_mem allocation."
-                if setting_value == '-1' else
-                f"log_temp_files is set to {setting_value}KB, which logs usage of temporary files "
-                f"larger than this threshold to help identify inefficient queries."
-            )
-        }
-        
-        return assessment
+            CheckResult: The log_temp_files assessment
+        """
+        setting_value = self._settings['log_temp_files']
+        if setting_value == -1:
+            return _LOG_TEMP_FILES_FAILED
+
+        return CheckResult(
+            parameter="log_temp_files",
+            check_result=CheckStatus.PASSED,
+            priority=Priority.LOW,
+            notes=_LOG_TEMP_FILES_PASSED_NOTES(threshold=setting_value)
+        )
+
+    def consume(self, results, settings):
+        """
+        Collect all monitoring-related settings assessments from the executed queries.
+
+        Args:
+            results: Cursors holding the results of queries(), in the same order
+            settings (SettingsCache): Settings of the assessed server
         
+        Returns:
+            list: A list of CheckResult objects, one per monitoring setting
+        """
+        self._settings = {name: settings[name][0] for name in self.SETTINGS}
+        return [
+            self._get_track_io_timing(),
+            self._get_track_wal_io_timing(),
+            self._get_track_commit_timestamp(),
+            self._get_log_lock_waits(),
+            self._get_log_temp_files()
+        ]
+
     def assess_monitoring_settings(self):
         """
         Collect all monitoring-related settings assessments.
         
         Returns:
-            list: A list of dictionaries containing assessment results for various 
-                  monitoring settings, each with the following keys:
-                  - 'result': Current value of the setting
-                  - 'check_result': 'warning' or 'pass' based on assessment
-                  - 'priority': Priority level of the finding
-                  - 'notes': Description of the finding
-        """
-        assessments = []
-        
-        # Collect all assessments
-        assessments.append(self._get_track_io_timing())
-        assessments.append(self._get_track_wal_io_timing())
-        assessments.append(self._get_track_commit_timestamp())
-        assessments.append(self._get_log_lock_waits())
-        assessments.append(self._get_log_temp_files())
-        
-        return assessments
\ No newline at end of file
+            list: A list of CheckResult objects, one per monitoring setting
+        """
+        return AssessmentRunner(self.connection, [self]).run()
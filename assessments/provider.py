@@ -0,0 +1,162 @@
+import warnings
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+import psycopg
+from psycopg_pool import ConnectionPool, PoolTimeout
+from .settings import SettingsCache
+
+# Providers opened with ConnectionProvider.shared(), keyed by their connection parameters
+_SHARED_PROVIDERS = {}
+
+def _recording_connection_class(errors):
+    """
+    Builds a connection class that records the errors of failed connection
+    attempts, which the pool would otherwise only log.
+
+    Args:
+        errors (list): List the errors are appended to
+
+    Returns:
+        type: psycopg.Connection subclass to pass as the pool's connection_class
+    """
+    class RecordingConnection(psycopg.Connection):
+        @classmethod
+        def connect(cls, *args, **kwargs):
+            try:
+                return super().connect(*args, **kwargs)
+            except psycopg.Error as e:
+                errors.append(e)
+                raise
+    return RecordingConnection
+
+@dataclass
+class ConnectionProvider:
+    """
+    A class to hand out short-lived PostgreSQL connections borrowed from a
+    psycopg_pool connection pool, so that runs reuse already established backends
+    instead of paying for a new connection each time. The provider also owns the
+    settings cache of the server it connects to.
+    """
+    pool: ConnectionPool
+    settings: SettingsCache = field(default_factory=SettingsCache)
+    _key: tuple = field(default=None, repr=False)
+    _users: int = field(default=0, repr=False)
+
+    @classmethod
+    def open(cls, connection_kwargs, min_size=2, max_size=8, configure=None, timeout=10):
+        """
+        Opens a connection pool, waits until its first connections are established
+        and wraps it in a ConnectionProvider.
+
+        Args:
+            connection_kwargs (dict): Keyword arguments for psycopg.connect
+            min_size (int): Number of connections kept open
+            max_size (int): Maximum number of connections
+            configure (callable, optional): Called with every new connection
+                before it is handed out
+            timeout (float): Seconds to wait for the first connections
+
+        Returns:
+            ConnectionProvider: Provider backed by the new pool
+
+        Raises:
+            psycopg.Error: The last connection error if the pool could not connect
+                in time, or PoolTimeout if no attempt failed
+        """
+        errors = []
+        pool = ConnectionPool(
+            kwargs=connection_kwargs,
+            min_size=min_size,
+            max_size=max_size,
+            configure=configure,
+            connection_class=_recording_connection_class(errors),
+            open=False
+        )
+        try:
+            pool.open(wait=True, timeout=timeout)
+        except PoolTimeout as e:
+            pool.close()
+            if errors:
+                raise errors[-1] from e
+            raise
+        return cls(pool)
+
+    @classmethod
+    def shared(cls, connection_kwargs, **pool_options):
+        """
+        Returns the provider of the server described by connection_kwargs, opening
+        it on first use. Later callers reuse the open pool, so they pay no new
+        connections; the pool options of the first caller apply.
+
+        Args:
+            connection_kwargs (dict): Keyword arguments for psycopg.connect
+            **pool_options: Keyword arguments for ConnectionProvider.open
+
+        Returns:
+            ConnectionProvider: Provider shared by every caller with the same
+                connection parameters, to be given back with release()
+        """
+        key = tuple(sorted(connection_kwargs.items()))
+        provider = _SHARED_PROVIDERS.get(key)
+        if provider is None:
+            provider = cls.open(connection_kwargs, **pool_options)
+            provider._key = key
+            _SHARED_PROVIDERS[key] = provider
+        provider._users += 1
+        return provider
+
+    def connection(self):
+        """
+        Borrows a connection from the pool.
+
+        Returns:
+            Context manager yielding a psycopg connection, returned to the pool on exit
+        """
+        return self.pool.connection()
+
+    def release(self):
+        """
+        Gives back a provider obtained from shared(). The pool is closed once its
+        last user has released it.
+        """
+        self._users -= 1
+        if self._users <= 0:
+            if _SHARED_PROVIDERS.get(self._key) is self:
+                del _SHARED_PROVIDERS[self._key]
+            self.close()
+
+    def close(self):
+        """
+        Closes the pool and all of its connections.
+        """
+        self.pool.close()
+
+
+def warn_deprecated_connection(source):
+    """
+    Warns when an assessment is created with a psycopg connection. Called from
+    the assessment's __init__, so the warning points at the code creating it.
+
+    Args:
+        source: A ConnectionProvider, or a psycopg connection (deprecated)
+    """
+    if not isinstance(source, ConnectionProvider):
+        warnings.warn(
+            "Passing a psycopg connection to assessments is deprecated, pass a ConnectionProvider instead.",
+            DeprecationWarning,
+            stacklevel=3
+        )
+
+def borrow_connection(source):
+    """
+    Borrows a connection from a ConnectionProvider.
+
+    Args:
+        source: A ConnectionProvider, or a psycopg connection (deprecated)
+
+    Returns:
+        Context manager yielding a psycopg connection
+    """
+    if isinstance(source, ConnectionProvider):
+        return source.connection()
+    return nullcontext(source)
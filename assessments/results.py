@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from enums import CheckStatus, Priority
+
+@dataclass(slots=True, frozen=True)
+class CheckResult:
+    """
+    A class to hold the outcome of a single configuration check.
+    """
+    parameter: str
+    check_result: CheckStatus
+    priority: Priority
+    notes: str
@@ -0,0 +1,137 @@
+from contextlib import ExitStack
+import psycopg
+from enums import CheckStatus, Priority
+from .results import CheckResult
+from .provider import ConnectionProvider, borrow_connection
+from .settings import SettingsCache
+
+class Assessment:
+    """
+    Base class of the assessments run by AssessmentRunner. Subclasses list the
+    pg_settings parameters they read in SETTINGS, name the parameter their
+    ERROR result is reported under in ERROR_PARAMETER and implement consume().
+    """
+    SETTINGS = []
+    ERROR_PARAMETER = None
+
+    def required_settings(self):
+        """
+        Returns the pg_settings parameters consume() reads.
+
+        Returns:
+            list: Names of the parameters
+        """
+        return self.SETTINGS
+
+    def queries(self):
+        """
+        Returns the queries needed by this assessment, in the order consume() expects them.
+
+        Returns:
+            list: List of (query, params) tuples
+        """
+        return []
+
+    def consume(self, results, settings):
+        """
+        Builds the assessment from the executed queries.
+
+        Args:
+            results: Cursors holding the results of queries(), in the same order
+            settings (SettingsCache): Settings of the assessed server
+
+        Returns:
+            list: List of CheckResult objects
+        """
+        raise NotImplementedError
+
+    def error_results(self, error):
+        """
+        Builds the results reported in place of the assessment when its queries
+        or consume() fail.
+
+        Args:
+            error (psycopg.Error): Error raised while running the assessment
+
+        Returns:
+            list: List of CheckResult objects
+        """
+        return [CheckResult(
+            parameter=self.ERROR_PARAMETER,
+            check_result=CheckStatus.ERROR,
+            priority=Priority.HIGH,
+            notes=f"Error: {error}"
+        )]
+
+
+class AssessmentRunner:
+    """
+    A class to run assessments over a single connection using libpq pipeline mode.
+
+    Every Assessment exposes queries() and consume(results, settings), and lists
+    the pg_settings parameters it reads in required_settings(). All queries,
+    including a single pg_settings lookup for every assessment, are sent to the
+    server before any result is read, so the whole batch costs roughly one
+    network round-trip.
+    """
+
+    def __init__(self, connection, assessments, settings=None):
+        """
+        Initialize the AssessmentRunner with a database connection.
+
+        Args:
+            connection: A ConnectionProvider, or a psycopg connection (deprecated)
+            assessments: Assessments to run, in the order their results are returned
+            settings (SettingsCache, optional): Settings cache of the server.
+                Defaults to the provider's cache, or a new cache for a bare connection.
+        """
+        self.connection = connection
+        self.assessments = assessments
+        if settings is None:
+            settings = connection.settings if isinstance(connection, ConnectionProvider) else SettingsCache()
+        self.settings = settings
+
+    def run(self):
+        """
+        Submits the queries of all assessments in pipeline mode, then lets each
+        assessment consume its own results. Every cursor is closed on exit, even
+        if a query or an assessment fails.
+
+        An assessment whose consume() fails reports its error_results() instead,
+        and if the pipeline itself fails every assessment does, so one failure
+        never discards the results of the other assessments.
+
+        Returns:
+            list: Combined assessment results
+        """
+        names = self.settings.missing(
+            name for assessment in self.assessments for name in assessment.required_settings()
+        )
+        settings_cursor = None
+        pending = []
+        try:
+            with borrow_connection(self.connection) as connection, ExitStack() as cursors_stack:
+                with connection.pipeline():
+                    if names:
+                        settings_cursor = cursors_stack.enter_context(
+                            connection.execute(SettingsCache.QUERY, (names,), prepare=True, binary=True)
+                        )
+                    for assessment in self.assessments:
+                        cursors = [
+                            cursors_stack.enter_context(connection.execute(query, params))
+                            for query, params in assessment.queries()
+                        ]
+                        pending.append((assessment, cursors))
+
+                if settings_cursor is not None:
+                    self.settings.store(settings_cursor.fetchall())
+
+                all_results = []
+                for assessment, cursors in pending:
+                    try:
+                        all_results.extend(assessment.consume(cursors, self.settings))
+                    except psycopg.Error as e:
+                        all_results.extend(assessment.error_results(e))
+                return all_results
+        except psycopg.Error as e:
+            return [result for assessment in self.assessments for result in assessment.error_results(e)]
@@ -0,0 +1,123 @@
+class SettingsCache:
+    """
+    A class to cache the pg_settings rows of one PostgreSQL server.
+
+    Each ConnectionProvider owns a cache, so instances pointed at different
+    servers never see each other's settings.
+
+    Settings needed by all assessments are fetched with a single query instead of
+    one pg_settings scan per parameter. Integer and real parameters are cast
+    server-side and fetched in binary format, so they are cached as int and float
+    without parsing text. Memory parameters are also converted to bytes by the
+    server with pg_size_bytes, so callers need no unit conversion tables.
+    QUERY is always executed as a server-side prepared statement, so pooled
+    connections parse and plan the pg_settings lookup only once.
+    """
+    QUERY = """
+        SELECT name, setting, unit,
+               CASE WHEN vartype = 'integer' THEN setting::bigint END,
+               CASE WHEN vartype = 'real' THEN setting::float8 END,
+               CASE WHEN unit LIKE '%%B' THEN pg_size_bytes(current_setting(name)) END
+        FROM pg_settings
+        WHERE name = ANY(%s);
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty settings cache.
+        """
+        self._settings = {}
+        self._sizes = {}
+
+    def __contains__(self, name):
+        return name in self._settings
+
+    def __getitem__(self, name):
+        return self._settings[name]
+
+    def get(self, name, default=None):
+        """
+        Returns the cached (setting, unit) tuple for a parameter.
+
+        Args:
+            name (str): Name of the parameter
+            default: Value returned if the parameter is not cached
+
+        Returns:
+            tuple: (setting, unit) as reported by pg_settings, with integer
+                   settings as int and real settings as float
+        """
+        return self._settings.get(name, default)
+
+    def get_bytes(self, name):
+        """
+        Returns the cached size of a memory parameter.
+
+        Args:
+            name (str): Name of the parameter
+
+        Returns:
+            int: Size in bytes as computed by pg_size_bytes
+
+        Raises:
+            KeyError: If the parameter is not cached or is not a memory parameter
+        """
+        return self._sizes[name]
+
+    def missing(self, names):
+        """
+        Returns the names that are not cached yet.
+
+        Args:
+            names: Names of the parameters to look up
+
+        Returns:
+            list: Names of the parameters missing from the cache
+        """
+        return [name for name in dict.fromkeys(names) if name not in self._settings]
+
+    def evict(self, names):
+        """
+        Drops the given parameters from the cache, so they are fetched again.
+
+        Args:
+            names: Names of the parameters to drop
+        """
+        for name in names:
+            self._settings.pop(name, None)
+            self._sizes.pop(name, None)
+
+    def store(self, rows):
+        """
+        Stores rows as returned by QUERY.
+
+        Args:
+            rows: Rows fetched from pg_settings
+        """
+        for name, setting, unit, integer_setting, real_setting, size_bytes in rows:
+            if size_bytes is not None:
+                self._sizes[name] = size_bytes
+            if integer_setting is not None:
+                setting = integer_setting
+            elif real_setting is not None:
+                setting = real_setting
+            self._settings[name] = (setting, unit)
+
+    def load(self, connection, names):
+        """
+        Fetches the given parameters from pg_settings in a single query,
+        skipping the ones that are already cached.
+
+        Args:
+            connection: A psycopg connection object
+            names: Names of the parameters to load
+
+        Returns:
+            SettingsCache: The cache itself
+        """
+        missing = self.missing(names)
+        if missing:
+            with connection.cursor() as cursor:
+                cursor.execute(self.QUERY, (missing,), prepare=True, binary=True)
+                self.store(cursor.fetchall())
+        return self
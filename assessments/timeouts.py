@@ -1,82 +1,80 @@
-import psycopg2
+from enums import CheckStatus, Priority
+from .results import CheckResult
+from .provider import warn_deprecated_connection
+from .runner import Assessment, AssessmentRunner
+
+# (parameter, notes when the timeout is disabled, notes format when it is set)
+# for every timeout that is checked
+_IDLE_CHECKS = (
+    ("idle_in_transaction_session_timeout", "No timeout set. Add timeout to prevent resource locks.", "Timeout set: {value} {unit}"),
+    ("idle_session_timeout", "No timeout set. Add timeout to terminate inactive sessions.", "Timeout set: {value} {unit}"),
+    ("statement_timeout", "No timeout set. Add timeout to prevent long-running queries.", "Timeout set: {value} {unit}")
+)
+
+def _build_timeout_result(parameter, setting, disabled_notes, enabled_notes):
+    """
+    Builds the result of a single timeout check.
+
+    Args:
+        parameter (str): Name of the timeout parameter
+        setting (tuple): Cached (value, unit) of the parameter, None if it is unknown
+        disabled_notes (str): Notes used when the timeout is disabled
+        enabled_notes (str): Notes format used when the timeout is set
+
+    Returns:
+        CheckResult: The timeout assessment
+    """
+    value, unit = setting or (0, None)
+    if value == 0:
+        return CheckResult(
+            parameter=parameter,
+            check_result=CheckStatus.FAILED,
+            priority=Priority.LOW,
+            notes=disabled_notes
+        )
+    return CheckResult(
+        parameter=parameter,
+        check_result=CheckStatus.PASSED,
+        priority=Priority.LOW,
+        notes=enabled_notes.format(value=value, unit=unit)
+    )
+
+class TimeoutsAssessment(Assessment):
+    SETTINGS = [parameter for parameter, _, _ in _IDLE_CHECKS]
+    ERROR_PARAMETER = "timeouts"
 
-class TimeoutsAssessment:
     def __init__(self, connection):
         """
         Initialize the Timeouts assessment with a database connection.
         Args:
-            connection: A psycopg2 connection object
+            connection: A ConnectionProvider, or a psycopg connection (deprecated)
         """
+        warn_deprecated_connection(connection)
         self.connection = connection
-    
-    def check_idle_timeouts(self):
+
+    def consume(self, results, settings):
         """
         Checks if idle_in_transaction_session_timeout, idle_session_timeout,
         and statement_timeout are configured with non-zero values.
-        
+
+        Args:
+            results: Cursors holding the results of queries(), in the same order
+            settings (SettingsCache): Settings of the assessed server
+
         Returns:
             list: List containing timeout assessments
         """
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT name, setting::int, unit
-                    FROM pg_settings 
-                    WHERE name IN (
-                        'idle_in_transaction_session_timeout', 
-                        'idle_session_timeout',
-                        'statement_timeout'
-                    );
-                """)
-                
-                settings = {row[0]: {"value": row[1], "unit": row[2]} for row in cursor.fetchall()}
-                results = []
-                
-                # Check idle_in_transaction_session_timeout
-                trans_timeout = settings.get('idle_in_transaction_session_timeout', {"value": 0})
-                is_trans_timeout_disabled = trans_timeout["value"] == 0
-                
-                results.append({
-                    "parameter": "idle_in_transaction_session_timeout",
-                    "check_result": "FAILED" if is_trans_timeout_disabled else "PASSED",
-                    "priority": "LOW",
-                    "notes": ("No timeout set. Add timeout to prevent resource locks."
-                            if is_trans_timeout_disabled else
-                            f"Timeout set: {trans_timeout['value']} {trans_timeout['unit']}")
-                })
-                
-                # Check idle_session_timeout
-                session_timeout = settings.get('idle_session_timeout', {"value": 0})
-                is_session_timeout_disabled = session_timeout["value"] == 0
-                
-                results.append({
-                    "parameter": "idle_session_timeout",
-                    "check_result": "FAILED" if is_session_timeout_disabled else "PASSED",
-                    "priority": "LOW",
-                    "notes": ("No timeout set. Add timeout to terminate inactive sessions."
-                            if is_session_timeout_disabled else
-                            f"Timeout set: {session_timeout['value']} {session_timeout['unit']}")
-                })
+        return [
+            _build_timeout_result(parameter, settings.get(parameter), disabled_notes, enabled_notes)
+            for parameter, disabled_notes, enabled_notes in _IDLE_CHECKS
+        ]
 
-                # Check statement_timeout
-                stmt_timeout = settings.get('statement_timeout', {"value": 0})
-                is_stmt_timeout_disabled = stmt_timeout["value"] == 0
-                
-                results.append({
-                    "parameter": "statement_timeout",
-                    "check_result": "FAILED" if is_stmt_timeout_disabled else "PASSED",
-                    "priority": "LOW",
-                    "notes": ("No timeout set. Add timeout to prevent long-running queries."
-                            if is_stmt_timeout_disabled else
-                            f"Timeout set: {stmt_timeout['value']} {stmt_timeout['unit']}")
-                })
-                
-                return results
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "timeouts",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error: {e}"
-            }]
+    def check_idle_timeouts(self):
+        """
+        Checks if idle_in_transaction_session_timeout, idle_session_timeout,
+        and statement_timeout are configured with non-zero values.
+
+        Returns:
+            list: List containing timeout assessments
+        """
+        return AssessmentRunner(self.connection, [self]).run()
@@ -0,0 +1,40 @@
+from .runner import Assessment
+
+class ServerVersionAssessment(Assessment):
+    """
+    A class to fetch the version of the assessed server in the same pipeline as
+    the other assessments. It reports no results of its own; the version is
+    kept in version and version_num.
+    """
+    ERROR_PARAMETER = "server_version"
+
+    def __init__(self):
+        """
+        Initialize the ServerVersionAssessment with an unknown version.
+        """
+        self.version = None
+        self.version_num = None
+
+    def queries(self):
+        """
+        Returns the queries needed by this assessment, in the order consume() expects them.
+
+        Returns:
+            list: List of (query, params) tuples
+        """
+        return [("SELECT version(), current_setting('server_version_num')::int;", None)]
+
+    def consume(self, results, settings):
+        """
+        Stores the version of the server from the executed query.
+
+        Args:
+            results: Cursors holding the results of queries(), in the same order
+            settings (SettingsCache): Settings of the assessed server
+
+        Returns:
+            list: Empty list, the version is not an assessment result
+        """
+        (version_cursor,) = results
+        self.version, self.version_num = version_cursor.fetchone()
+        return []
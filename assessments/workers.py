@@ -1,109 +1,126 @@
-import pandas as pd
-from tabulate import tabulate
-from pathlib import Path
-from enums.storage_type import StorageType
-from enums.deployment_type import DeploymentType
-import psycopg2
+from enums import CheckStatus, Priority
+from .results import CheckResult
+from .provider import warn_deprecated_connection
+from .runner import Assessment, AssessmentRunner
 
-class WorkerAssessment:
+# Notes of the worker count checks
+_SUBOPTIMAL_WORKERS_NOTES = "Current: {current}, Recommended: {recommended} for {cpus} CPUs".format
+_OPTIMAL_WORKERS_NOTES = "Optimal for {cpus} CPUs".format
+
+class WorkerAssessment(Assessment):
     """
     A class to assess PostgreSQL worker configurations.
     """
+    SETTINGS = [
+        'autovacuum_max_workers',
+        'max_parallel_maintenance_workers'
+    ]
+
     def __init__(self, connection, cpu_count):
         """
         Initialize the WorkerAssessment with a database connection.
 
         Args:
-            connection: A psycopg2 connection object
+            connection: A ConnectionProvider, or a psycopg connection (deprecated)
             cpu_count: Number of CPUs
         """
+        warn_deprecated_connection(connection)
         self.connection = connection
         self.cpu_count = cpu_count
-    def _check_autovacuum_max_workers(self):
+        # Recommended worker counts only depend on cpu_count, so compute them once
+        self._recommended_autovacuum = min(max(3, self.cpu_count // 5), 16)
+        self._recommended_parallel_maint = min(max(2, self.cpu_count // 8), 8)
+
+    def _check_autovacuum_max_workers(self, settings):
         """
         Checks if autovacuum_max_workers is properly configured based on CPU count.
         Uses formula: autovacuum_max_workers = min(max(3, n/5), 16) where n is cpu_count.
         
+        Args:
+            settings (SettingsCache): Settings of the assessed server
+
         Returns:
             list: List containing autovacuum_max_workers assessment
         """
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT setting::int
-                    FROM pg_settings 
-                    WHERE name = 'autovacuum_max_workers';
-                """)
-                
-                current_workers = cursor.fetchone()[0]
-                
-                # Calculate recommended workers using the formula
-                recommended_workers = min(max(3, int(self.cpu_count/5)), 16)
-                
-                is_suboptimal = current_workers != recommended_workers
-                
-                return [{
-                    "parameter": "autovacuum_max_workers",
-                    "check_result": "FAILED" if is_suboptimal else "PASSED",
-                    "priority": "MEDIUM",
-                    "notes": (f"Current: {current_workers}, Recommended: {recommended_workers} for {self.cpu_count} CPUs"
-                            if is_suboptimal else
-                            f"Optimal for {self.cpu_count} CPUs")
-                }]
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "autovacuum_max_workers",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error checking autovacuum_max_workers parameter: {e}"
-            }]
+        current_workers = settings['autovacuum_max_workers'][0]
+        recommended_workers = self._recommended_autovacuum
+        
+        is_suboptimal = current_workers != recommended_workers
+        
+        return [CheckResult(
+            parameter="autovacuum_max_workers",
+            check_result=CheckStatus.FAILED if is_suboptimal else CheckStatus.PASSED,
+            priority=Priority.MEDIUM,
+            notes=(_SUBOPTIMAL_WORKERS_NOTES(current=current_workers, recommended=recommended_workers, cpus=self.cpu_count)
+                    if is_suboptimal else
+                    _OPTIMAL_WORKERS_NOTES(cpus=self.cpu_count))
+        )]
 
-    def _check_max_parallel_maintenance_workers(self):
+    def _check_max_parallel_maintenance_workers(self, settings):
         """
         Checks if max_parallel_maintenance_workers is properly configured based on CPU count.
         Uses formula: max_parallel_maintenance_workers = min(max(2, n/8), 8) where n is cpu_count.
         
+        Args:
+            settings (SettingsCache): Settings of the assessed server
+
         Returns:
             list: List containing max_parallel_maintenance_workers assessment
         """
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT setting::int
-                    FROM pg_settings 
-                    WHERE name = 'max_parallel_maintenance_workers';
-                """)
-                
-                current_workers = cursor.fetchone()[0]
-                
-                # Calculate recommended workers using the formula
-                recommended_workers = min(max(2, int(self.cpu_count/8)), 8)
-                
-                is_suboptimal = current_workers != recommended_workers
-                
-                return [{
-                    "parameter": "max_parallel_maintenance_workers",
-                    "check_result": "FAILED" if is_suboptimal else "PASSED",
-                    "priority": "MEDIUM",
-                    "notes": (f"Current: {current_workers}, Recommended: {recommended_workers} for {self.cpu_count} CPUs"
-                            if is_suboptimal else
-                            f"Optimal for {self.cpu_count} CPUs")
-                }]
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "max_parallel_maintenance_workers",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error checking max_parallel_maintenance_workers parameter: {e}"
-            }]
+        current_workers = settings['max_parallel_maintenance_workers'][0]
+        recommended_workers = self._recommended_parallel_maint
         
+        is_suboptimal = current_workers != recommended_workers
+        
+        return [CheckResult(
+            parameter="max_parallel_maintenance_workers",
+            check_result=CheckStatus.FAILED if is_suboptimal else CheckStatus.PASSED,
+            priority=Priority.MEDIUM,
+            notes=(_SUBOPTIMAL_WORKERS_NOTES(current=current_workers, recommended=recommended_workers, cpus=self.cpu_count)
+                    if is_suboptimal else
+                    _OPTIMAL_WORKERS_NOTES(cpus=self.cpu_count))
+        )]
+
+    def consume(self, results, settings):
+        """
+        Builds the worker assessments from the executed queries.
+
+        Args:
+            results: Cursors holding the results of queries(), in the same order
+            settings (SettingsCache): Settings of the assessed server
+
+        Returns:
+            list: List containing worker assessments
+        """
+        all_results=[]
+        all_results.extend(self._check_autovacuum_max_workers(settings))
+        all_results.extend(self._check_max_parallel_maintenance_workers(settings))
+        return all_results
+
+    def error_results(self, error):
+        """
+        Builds one ERROR result per worker parameter.
+
+        Args:
+            error (psycopg.Error): Error raised while running the assessment
+
+        Returns:
+            list: List containing worker assessments
+        """
+        return [CheckResult(
+            parameter="autovacuum_max_workers",
+            check_result=CheckStatus.ERROR,
+            priority=Priority.HIGH,
+            notes=f"Error checking autovacuum_max_workers parameter: {error}"
+        ), CheckResult(
+            parameter="max_parallel_maintenance_workers",
+            check_result=CheckStatus.ERROR,
+            priority=Priority.HIGH,
+            notes=f"Error checking max_parallel_maintenance_workers parameter: {error}"
+        )]
+
     def prepare_worker_stats(self):
         """
         Prepare worker statistics for display.
         """
-        all_results=[]
-        all_results.extend(self._check_autovacuum_max_workers())
-        all_results.extend(self._check_max_parallel_maintenance_workers())
-        return all_results
\ No newline at end of file
+        return AssessmentRunner(self.connection, [self]).run()
@@ -1,25 +1,217 @@
 import os
 import sys
-import psycopg2
-import psutil
+import csv
+import stat
+import psycopg
 import argparse
-import pandas as pd
-from tabulate import tabulate
-from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
+from dataclasses import fields
+from operator import attrgetter
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from enums.storage_type import StorageType
 from enums.deployment_type import DeploymentType
-from assessments import CheckpointAssessment, WorkerAssessment
+from enums.check_status import CheckStatus
+from enums.priority import Priority
+from assessments import CheckpointAssessment, WorkerAssessment, AssessmentRunner, CheckResult, ConnectionProvider
 from assessments.timeouts import TimeoutsAssessment
 from assessments.observability import ObservabilityAssessment
+from assessments.version import ServerVersionAssessment
+
+# Column headers of the formatted results, in CheckResult field order
+_RESULT_FIELDS = [field.name for field in fields(CheckResult)]
+
+def _to_mb(size_bytes):
+    """
+    Converts a memory size to MB.
+
+    Args:
+        size_bytes (int): Size in bytes
+
+    Returns:
+        float: Size in MB
+    """
+    return size_bytes / (1024 * 1024)
+
+
+# Failure notes of the memory and connection checks, as bound str.format methods
+_SHARED_BUFFERS_FAILED_NOTES = "Exceeds 40% of memory ({used:.1f}GB/{limit:.1f}GB). Reduce to prevent OS pressure.".format
+_MAX_CONNECTIONS_FAILED_NOTES = (
+    "Memory usage ({needed:.1f}GB) may exceed available ({available}GB). "
+    "Reduce connections ({connections}) or work_mem ({work_mem:.0f}MB)."
+).format
+_MAINTENANCE_WORK_MEM_FAILED_NOTES = "Exceeds 1GB ({used:.0f}MB). Reduce to prevent excessive memory usage.".format
+_WORK_MEM_FAILED_NOTES = (
+    "Potential usage ({used:.0f}MB) exceeds 25% limit ({limit:.0f}MB). "
+    "Reduce work_mem or connections."
+).format
+
+# Error notes of each parameter check, in the order check_all_parameters runs them
+_CHECK_ERROR_NOTES = {
+    "random_page_cost/seq_page_cost": "Error: {error}".format,
+    "shared_buffers": "Error fetching shared_buffers parameter: {error}".format,
+    "max_connections": "Error checking memory configuration: {error}".format,
+    "maintenance_work_mem": "Error checking maintenance_work_mem parameter: {error}".format,
+    "work_mem": "Error checking work_mem parameter: {error}".format
+}
+
+def _check_error(parameter, error):
+    """
+    Builds the ERROR result of a parameter check.
+
+    Args:
+        parameter (str): Parameter reported by the check
+        error (psycopg.Error): Error raised while fetching the settings
+
+    Returns:
+        CheckResult: The ERROR assessment
+    """
+    return CheckResult(
+        parameter=parameter,
+        check_result=CheckStatus.ERROR,
+        priority=Priority.HIGH,
+        notes=_CHECK_ERROR_NOTES[parameter](error=error)
+    )
+
+# Lowercase command line values mapped to their enum members
+_STORAGE_CHOICES = {storage_type.value.lower(): storage_type for storage_type in StorageType}
+_DEPLOYMENT_CHOICES = {deployment_type.value.lower(): deployment_type for deployment_type in DeploymentType}
+
+def _enum_choice(choices):
+    """
+    Builds an argparse type that converts a case-insensitive value to its enum member.
+
+    Args:
+        choices (dict): Lowercase values mapped to enum members
+
+    Returns:
+        callable: Converter raising argparse.ArgumentTypeError for unknown values
+    """
+    def convert(value):
+        try:
+            return choices[value.lower()]
+        except KeyError:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: '{value}' (choose from {', '.join(choices)})"
+            ) from None
+    return convert
+
+
+@lru_cache(maxsize=1)
+def _default_cpu():
+    """
+    Returns the number of CPUs usable by this process, probed once per process.
+    Uses the CPU affinity mask where the platform supports it.
+
+    Returns:
+        int: Number of logical CPUs
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+
+@lru_cache(maxsize=1)
+def _default_mem_gb():
+    """
+    Returns the total memory of the host in GB, probed once per process.
+    Reads /proc/meminfo where available and only falls back to psutil elsewhere.
+
+    Returns:
+        int: Total memory in GB, rounded
+    """
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemTotal:'):
+                    # Reported in kB
+                    return round(int(line.split()[1]) / (1024**2))
+    except OSError:
+        pass
+    import psutil
+    return round(psutil.virtual_memory().total / (1024**3))
+
+
+def _configure_connection(connection):
+    """
+    Makes a new pooled connection read-only. This is set with a SET statement
+    rather than the options startup parameter, which PgBouncer rejects unless
+    it is listed in ignore_startup_parameters.
+
+    Args:
+        connection: A psycopg connection in autocommit mode
+    """
+    connection.execute("SET default_transaction_read_only = on;")
+
+
+# Environment variables required with and without a PGPASSFILE
+_PGPASS_REQUIRED_VARS = ('POSTGRES_HOST', 'POSTGRES_PORT', 'POSTGRES_DB')
+_REQUIRED_VARS = _PGPASS_REQUIRED_VARS + ('POSTGRES_USER', 'POSTGRES_PASSWORD')
+
+@lru_cache(maxsize=1)
+def _load_pg_env_config():
+    """
+    Ensures that all required PostgreSQL environment variables are set and not empty.
+    The environment is read once per process; call _load_pg_env_config.cache_clear()
+    to read it again.
+    
+    Returns:
+        MappingProxyType: Read-only mapping containing all PostgreSQL environment variables
+        
+    Raises:
+        SystemExit: If required environment variables are missing or empty
+    """
+    env = os.environ
+    pgpass_file = env.get('PGPASSFILE')
+    required_vars = _PGPASS_REQUIRED_VARS if pgpass_file else _REQUIRED_VARS
+    
+    postgres_config = {var: env[var] for var in required_vars if env.get(var)}
+    missing_vars = [var for var in required_vars if var not in postgres_config]
+    
+    if pgpass_file:
+        postgres_config['PGPASSFILE'] = pgpass_file
+        # A single stat() serves both the file type and the permission checks
+        try:
+            pgpass_mode = os.stat(pgpass_file).st_mode
+        except OSError:
+            pgpass_mode = 0
+        if not stat.S_ISREG(pgpass_mode):
+            print(f"Error: PGPASSFILE '{pgpass_file}' does not exist or is not a file.")
+            sys.exit(1)
+        if os.name == 'posix':
+            permissions = pgpass_mode & 0o777
+            if permissions != 0o600:
+                print(f"Warning: pgpass file permissions are {permissions:03o}, should be 600")
+    
+    if missing_vars:
+        print("Error: The following required PostgreSQL environment variables are missing or empty:")
+        for var in missing_vars:
+            print(f"  - {var}")
+        print("\nPlease set these environment variables before running this script.")
+        sys.exit(1)
+    
+    return MappingProxyType(postgres_config)
+
 
 class PostgresqlConnection:
     """
     A class to manage PostgreSQL database connections with environment variables
     or PGPASSFILE authentication support.
     """
+    # Every pg_settings parameter read by the check_* methods
+    SETTINGS = [
+        'random_page_cost',
+        'seq_page_cost',
+        'shared_buffers',
+        'work_mem',
+        'max_connections',
+        'maintenance_work_mem'
+    ]
     
     def __init__(self, cpu_count: int = None, memory_gb: int = None, storage_type: StorageType = None, 
-                 desired_rto_in_minutes: int = None, deployment_type: DeploymentType = None):
+                 desired_rto_in_minutes: int = None, deployment_type: DeploymentType = None,
+                 max_pool_size: int = 8):
         """
         Initialize PostgreSQL connection by checking configurations
         and establishing the connection.
@@ -30,20 +222,25 @@ class PostgresqlConnection:
             storage_type (StorageType, optional): Storage backend type. Defaults to SSD.
             desired_rto_in_minutes (int, optional): Desired Recovery Time Objective in minutes.
             deployment_type (DeploymentType, optional): Type of deployment (ONPREM or RDS).
+            max_pool_size (int, optional): Maximum number of pooled connections. Defaults to 8.
         """
-        # Set system properties
-        self.cpu_count = cpu_count if cpu_count is not None else psutil.cpu_count()
-        self.memory_gb = memory_gb if memory_gb is not None else round(psutil.virtual_memory().total / (1024**3))
+        # Set system properties, probing the host only when needed
+        self.cpu_count = cpu_count if cpu_count is not None else _default_cpu()
+        self.memory_gb = memory_gb if memory_gb is not None else _default_mem_gb()
         self.storage_type = storage_type if storage_type is not None else StorageType.SSD
         self.desired_rto_in_minutes = desired_rto_in_minutes
         self.deployment_type = deployment_type if deployment_type is not None else DeploymentType.ONPREM
+        self.max_pool_size = max_pool_size
 
         # Validate properties
         self._validate_properties()
 
         # Initialize connection
         self.config = self._check_postgres_env_variables()
-        self.connection = self._establish_connection()
+        self.provider = self._establish_connection()
+        # Settings are memoized per server, alongside the pool connected to it
+        self._settings_cache = self.provider.settings
+        self._results_cache = None
 
     def _validate_properties(self):
         """
@@ -65,6 +262,9 @@ class PostgresqlConnection:
             if not isinstance(self.desired_rto_in_minutes, int) or self.desired_rto_in_minutes <= 0:
                 raise ValueError(f"RTO must be a positive integer in minutes, got {self.desired_rto_in_minutes}")
 
+        if not isinstance(self.max_pool_size, int) or self.max_pool_size <= 0:
+            raise ValueError(f"Pool size must be a positive integer, got {self.max_pool_size}")
+
     def get_system_info(self) -> dict:
         """
         Returns the system properties of the PostgreSQL instance.
@@ -85,104 +285,136 @@ class PostgresqlConnection:
         Ensures that all required PostgreSQL environment variables are set and not empty.
         
         Returns:
-            dict: Dictionary containing all PostgreSQL environment variables
+            MappingProxyType: Read-only mapping containing all PostgreSQL environment variables
             
         Raises:
             SystemExit: If required environment variables are missing or empty
         """
-        pgpass_file = os.environ.get('PGPASSFILE')
-        
-        if pgpass_file:
-            required_vars = [
-                'POSTGRES_HOST',
-                'POSTGRES_PORT',
-                'POSTGRES_DB'
-            ]
+        return _load_pg_env_config()
+
+    def _connection_kwargs(self):
+        """
+        Builds the connection parameters from the verified configuration.
+        Queries are server-side prepared from their second execution onwards.
+        Connections run in autocommit mode, so the read-only checks never leave
+        a backend idle in transaction and pooled connections need no rollback
+        when they are returned.
+
+        Returns:
+            dict: Keyword arguments for psycopg.connect
+        """
+        kwargs = {
+            'host': self.config['POSTGRES_HOST'],
+            'port': self.config['POSTGRES_PORT'],
+            'dbname': self.config['POSTGRES_DB'],
+            'prepare_threshold': 1,
+            'autocommit': True
+        }
+        if 'PGPASSFILE' in self.config:
+            os.environ['PGPASSFILE'] = self.config['PGPASSFILE']
         else:
-            required_vars = [
-                'POSTGRES_HOST',
-                'POSTGRES_PORT',
-                'POSTGRES_DB',
-                'POSTGRES_USER',
-                'POSTGRES_PASSWORD'
-            ]
-        
-        postgres_config = {}
-        missing_vars = []
-        
-        for var in required_vars:
-            value = os.environ.get(var)
-            if not value:
-                missing_vars.append(var)
-            else:
-                postgres_config[var] = value
-        
-        if pgpass_file:
-            postgres_config['PGPASSFILE'] = pgpass_file
-            if not Path(pgpass_file).is_file():
-                print(f"Error: PGPASSFILE '{pgpass_file}' does not exist or is not a file.")
-                sys.exit(1)
-            if os.name == 'posix':
-                permissions = oct(Path(pgpass_file).stat().st_mode)[-3:]
-                if permissions != '600':
-                    print(f"Warning: pgpass file permissions are {permissions}, should be 600")
-        
-        if missing_vars:
-            print(f"Error: The following required PostgreSQL environment variables are missing or empty:")
-            for var in missing_vars:
-                print(f"  - {var}")
-            print("\nPlease set these environment variables before running this script.")
-            sys.exit(1)
-        
-        return postgres_config
+            kwargs['user'] = self.config['POSTGRES_USER']
+            kwargs['password'] = self.config['POSTGRES_PASSWORD']
+        return kwargs
 
     def _establish_connection(self):
         """
-        Establishes a connection to PostgreSQL using the verified configuration.
+        Returns the pool of connections to the configured server, shared with
+        every other instance pointed at the same server. The pool is opened, and
+        its first connections established, only on first use.
         
         Returns:
-            connection: psycopg2 connection object
-            
-        Raises:
-            psycopg2.Error: If connection fails
+            ConnectionProvider: Provider handing out pooled connections
         """
         try:
-            if 'PGPASSFILE' in self.config:
-                os.environ['PGPASSFILE'] = self.config['PGPASSFILE']
-                connection = psycopg2.connect(
-                    host=self.config['POSTGRES_HOST'],
-                    port=self.config['POSTGRES_PORT'],
-                    database=self.config['POSTGRES_DB']
-                )
-            else:
-                connection = psycopg2.connect(
-                    host=self.config['POSTGRES_HOST'],
-                    port=self.config['POSTGRES_PORT'],
-                    database=self.config['POSTGRES_DB'],
-                    user=self.config['POSTGRES_USER'],
-                    password=self.config['POSTGRES_PASSWORD']
-                )
-            return connection
-        except psycopg2.Error as e:
-            print(f"Error: Could not connect to PostgreSQL database:")
+            return ConnectionProvider.shared(
+                self._connection_kwargs(),
+                min_size=min(2, self.max_pool_size),
+                max_size=self.max_pool_size,
+                configure=_configure_connection
+            )
+        except psycopg.Error as e:
+            print("Error: Could not connect to PostgreSQL database:")
             print(f"  {str(e)}")
             sys.exit(1)
 
     def get_connection(self):
         """
-        Returns the established database connection.
+        Borrows a connection from the pool.
         
         Returns:
-            connection: psycopg2 connection object
+            Context manager yielding a psycopg connection, returned to the pool on exit
+        """
+        return self.provider.connection()
+
+    def get_provider(self):
+        """
+        Returns the pooled connection provider used by the assessments.
+
+        Returns:
+            ConnectionProvider: Provider handing out pooled connections
         """
-        return self.connection
+        return self.provider
+
+    def get_server_version(self):
+        """
+        Fetches the version of the PostgreSQL server in a single round-trip.
+
+        Returns:
+            tuple: (version string for display, server_version_num as int)
+
+        Raises:
+            psycopg.Error: If the query fails
+        """
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT version(), current_setting('server_version_num')::int;",
+                binary=True
+            )
+            return cursor.fetchone()
+
+    def run_assessments(self, assessments):
+        """
+        Runs the given assessments on a connection borrowed from the pool. An
+        assessment that fails reports ERROR results instead of its checks.
+
+        Args:
+            assessments (list): Assessments to run
+
+        Returns:
+            list: Combined assessment results
+        """
+        return AssessmentRunner(self.provider, assessments).run()
 
     def close_connection(self):
         """
-        Closes the database connection if it exists.
+        Releases the shared connection pool if it exists. The pool is closed
+        once no instance uses it anymore.
+        """
+        if getattr(self, 'provider', None) is not None:
+            self.provider.release()
+            self.provider = None
+
+    def _load_settings(self, names):
+        """
+        Fetches the given parameters from pg_settings in a single query and memoizes
+        them in this server's settings cache. Parameters that are already cached
+        are not fetched again, and no connection is borrowed from the pool when
+        all of them are cached.
+
+        Args:
+            names (list): Names of the parameters to load
+
+        Returns:
+            SettingsCache: Cache mapping parameter names to (setting, unit) tuples
+
+        Raises:
+            psycopg.Error: If the query fails
         """
-        if hasattr(self, 'connection') and self.connection is not None:
-            self.connection.close()
+        if self._settings_cache.missing(names):
+            with self.get_connection() as connection:
+                self._settings_cache.load(connection, names)
+        return self._settings_cache
 
     def check_page_cost_parameters(self):
         """
@@ -190,38 +422,26 @@ class PostgresqlConnection:
         and provides assessment in a tabular format.
         
         Returns:
-            list: List of dictionaries containing parameter assessments
+            list: List of CheckResult objects containing parameter assessments
         """
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT name, setting::float
-                    FROM pg_settings 
-                    WHERE name IN ('random_page_cost', 'seq_page_cost');
-                """)
-                
-                settings = {row[0]: row[1] for row in cursor.fetchall()}
-                random_page_cost = settings['random_page_cost']
-                seq_page_cost = settings['seq_page_cost']
-                cost_difference = random_page_cost - seq_page_cost
-                
-                is_failed = (self.storage_type == StorageType.SSD and cost_difference > 0.3)
-                
-                return [{
-                    "parameter": "random_page_cost/seq_page_cost",
-                    "check_result": "FAILED" if is_failed else "PASSED",
-                    "priority": "MEDIUM" if is_failed else "LOW",
-                    "notes": ("For SSD: reduce random_page_cost to within 0.1-0.3 of seq_page_cost" 
-                            if is_failed else "Optimal for current storage type")
-                }]
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "random_page_cost/seq_page_cost",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error: {e}"
-            }]
+            settings = self._load_settings(['random_page_cost', 'seq_page_cost'])
+            random_page_cost = settings['random_page_cost'][0]
+            seq_page_cost = settings['seq_page_cost'][0]
+            cost_difference = random_page_cost - seq_page_cost
+            
+            is_failed = (self.storage_type == StorageType.SSD and cost_difference > 0.3)
+            
+            return [CheckResult(
+                parameter="random_page_cost/seq_page_cost",
+                check_result=CheckStatus.FAILED if is_failed else CheckStatus.PASSED,
+                priority=Priority.MEDIUM if is_failed else Priority.LOW,
+                notes=("For SSD: reduce random_page_cost to within 0.1-0.3 of seq_page_cost" 
+                        if is_failed else "Optimal for current storage type")
+            )]
+            
+        except psycopg.Error as e:
+            return [_check_error("random_page_cost/seq_page_cost", e)]
 
     def check_shared_buffers(self):
         """
@@ -232,47 +452,23 @@ class PostgresqlConnection:
             list: List containing shared_buffers assessment
         """
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT setting, unit 
-                    FROM pg_settings 
-                    WHERE name = 'shared_buffers';
-                """)
-                
-                setting, unit = cursor.fetchone()
-                shared_buffers_value = int(setting)
-                
-                # Convert shared_buffers to GB based on unit
-                if unit == 'kB':
-                    shared_buffers_gb = shared_buffers_value / (1024 * 1024)
-                elif unit == 'MB':
-                    shared_buffers_gb = shared_buffers_value / 1024
-                elif unit == '8kB':
-                    shared_buffers_gb = (shared_buffers_value * 8) / (1024 * 1024)
-                elif unit == 'GB':
-                    shared_buffers_gb = shared_buffers_value
-                else:
-                    shared_buffers_gb = 0
-                
-                memory_threshold = self.memory_gb * 0.4
-                is_failed = shared_buffers_gb > memory_threshold
-                
-                return [{
-                    "parameter": "shared_buffers",
-                    "check_result": "FAILED" if is_failed else "PASSED",
-                    "priority": "HIGH",
-                    "notes": (f"Exceeds 40% of memory ({shared_buffers_gb:.1f}GB/{memory_threshold:.1f}GB). Reduce to prevent OS pressure."
-                            if is_failed else
-                            "Within acceptable range")
-                }]
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "shared_buffers",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error fetching shared_buffers parameter: {e}"
-            }]
+            settings = self._load_settings(['shared_buffers'])
+            shared_buffers_gb = _to_mb(settings.get_bytes('shared_buffers')) / 1024
+            
+            memory_threshold = self.memory_gb * 0.4
+            is_failed = shared_buffers_gb > memory_threshold
+            
+            return [CheckResult(
+                parameter="shared_buffers",
+                check_result=CheckStatus.FAILED if is_failed else CheckStatus.PASSED,
+                priority=Priority.HIGH,
+                notes=(_SHARED_BUFFERS_FAILED_NOTES(used=shared_buffers_gb, limit=memory_threshold)
+                        if is_failed else
+                        "Within acceptable range")
+            )]
+            
+        except psycopg.Error as e:
+            return [_check_error("shared_buffers", e)]
 
 
     def check_max_connections_memory(self):
@@ -284,76 +480,34 @@ class PostgresqlConnection:
             list: List containing max_connections memory assessment
         """
         try:
-            with self.connection.cursor() as cursor:
-                # Get max_connections
-                cursor.execute("""
-                    SELECT setting::int
-                    FROM pg_settings 
-                    WHERE name = 'max_connections';
-                """)
-                max_connections = cursor.fetchone()[0]
-
-                # Get work_mem and its unit
-                cursor.execute("""
-                    SELECT setting, unit
-                    FROM pg_settings 
-                    WHERE name = 'work_mem';
-                """)
-                work_mem_value, work_mem_unit = cursor.fetchone()
-                work_mem_value = int(work_mem_value)
-
-                # Convert work_mem to MB
-                if work_mem_unit == 'kB':
-                    work_mem_mb = work_mem_value / 1024
-                elif work_mem_unit == '8kB':
-                    work_mem_mb = (work_mem_value * 8) / 1024
-                elif work_mem_unit == 'GB':
-                    work_mem_mb = work_mem_value * 1024
-                else:  # MB
-                    work_mem_mb = work_mem_value
-
-                # Get shared_buffers and its unit
-                cursor.execute("""
-                    SELECT setting, unit
-                    FROM pg_settings 
-                    WHERE name = 'shared_buffers';
-                """)
-                shared_buffers_value, shared_buffers_unit = cursor.fetchone()
-                shared_buffers_value = int(shared_buffers_value)
-
-                # Convert shared_buffers to GB
-                if shared_buffers_unit == 'kB':
-                    shared_buffers_gb = shared_buffers_value / (1024 * 1024)
-                elif shared_buffers_unit == 'MB':
-                    shared_buffers_gb = shared_buffers_value / 1024
-                elif shared_buffers_unit == '8kB':
-                    shared_buffers_gb = (shared_buffers_value * 8) / (1024 * 1024)
-                else:  # GB
-                    shared_buffers_gb = shared_buffers_value
-
-                # Calculate total potential memory usage in GB
-                total_work_mem_gb = (work_mem_mb * max_connections) / 1024
-                total_memory_needed_gb = total_work_mem_gb + shared_buffers_gb
-                
-                is_failed = total_memory_needed_gb >= self.memory_gb
-                
-                return [{
-                    "parameter": "max_connections",
-                    "check_result": "FAILED" if is_failed else "PASSED",
-                    "priority": "HIGH",
-                    "notes": (f"Memory usage ({total_memory_needed_gb:.1f}GB) may exceed available ({self.memory_gb}GB). "
-                            f"Reduce connections ({max_connections}) or work_mem ({work_mem_mb:.0f}MB)."
-                            if is_failed else
-                            "Memory configuration within safe limits")
-                }]
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "max_connections",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error checking memory configuration: {e}"
-            }]
+            settings = self._load_settings(['max_connections', 'work_mem', 'shared_buffers'])
+
+            max_connections = settings['max_connections'][0]
+            work_mem_mb = _to_mb(settings.get_bytes('work_mem'))
+            shared_buffers_gb = _to_mb(settings.get_bytes('shared_buffers')) / 1024
+
+            # Calculate total potential memory usage in GB
+            total_work_mem_gb = (work_mem_mb * max_connections) / 1024
+            total_memory_needed_gb = total_work_mem_gb + shared_buffers_gb
+            
+            is_failed = total_memory_needed_gb >= self.memory_gb
+            
+            return [CheckResult(
+                parameter="max_connections",
+                check_result=CheckStatus.FAILED if is_failed else CheckStatus.PASSED,
+                priority=Priority.HIGH,
+                notes=(_MAX_CONNECTIONS_FAILED_NOTES(
+                            needed=total_memory_needed_gb,
+                            available=self.memory_gb,
+                            connections=max_connections,
+                            work_mem=work_mem_mb
+                        )
+                        if is_failed else
+                        "Memory configuration within safe limits")
+            )]
+            
+        except psycopg.Error as e:
+            return [_check_error("max_connections", e)]
 
     def check_maintenance_work_mem(self):
         """
@@ -363,45 +517,23 @@ class PostgresqlConnection:
             list: List containing maintenance_work_mem assessment
         """
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT setting, unit
-                    FROM pg_settings 
-                    WHERE name = 'maintenance_work_mem';
-                """)
-                
-                setting, unit = cursor.fetchone()
-                mem_value = int(setting)
-                
-                # Convert to MB for comparison
-                if unit == 'kB':
-                    mem_mb = mem_value / 1024
-                elif unit == '8kB':
-                    mem_mb = (mem_value * 8) / 1024
-                elif unit == 'GB':
-                    mem_mb = mem_value * 1024
-                else:  # MB
-                    mem_mb = mem_value
-                
-                # Check if greater than 1GB (1024MB)
-                is_too_large = mem_mb > 1024
-                
-                return [{
-                    "parameter": "maintenance_work_mem",
-                    "check_result": "FAILED" if is_too_large else "PASSED",
-                    "priority": "MEDIUM",
-                    "notes": (f"Exceeds 1GB ({mem_mb:.0f}MB). Reduce to prevent excessive memory usage."
-                            if is_too_large else
-                            "Within recommended limits")
-                }]
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "maintenance_work_mem",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error checking maintenance_work_mem parameter: {e}"
-            }]
+            settings = self._load_settings(['maintenance_work_mem'])
+            mem_mb = _to_mb(settings.get_bytes('maintenance_work_mem'))
+            
+            # Check if greater than 1GB (1024MB)
+            is_too_large = mem_mb > 1024
+            
+            return [CheckResult(
+                parameter="maintenance_work_mem",
+                check_result=CheckStatus.FAILED if is_too_large else CheckStatus.PASSED,
+                priority=Priority.MEDIUM,
+                notes=(_MAINTENANCE_WORK_MEM_FAILED_NOTES(used=mem_mb)
+                        if is_too_large else
+                        "Within recommended limits")
+            )]
+            
+        except psycopg.Error as e:
+            return [_check_error("maintenance_work_mem", e)]
 
 
 
@@ -415,83 +547,34 @@ class PostgresqlConnection:
             list: List containing work_mem assessment
         """
         try:
-            with self.connection.cursor() as cursor:
-                # Get work_mem and its unit
-                cursor.execute("""
-                    SELECT setting, unit
-                    FROM pg_settings 
-                    WHERE name = 'work_mem';
-                """)
-                work_mem_value, work_mem_unit = cursor.fetchone()
-                work_mem_value = int(work_mem_value)
-
-                # Convert work_mem to MB
-                if work_mem_unit == 'kB':
-                    work_mem_mb = work_mem_value / 1024
-                elif work_mem_unit == '8kB':
-                    work_mem_mb = (work_mem_value * 8) / 1024
-                elif work_mem_unit == 'GB':
-                    work_mem_mb = work_mem_value * 1024
-                else:  # MB
-                    work_mem_mb = work_mem_value
-
-                # Get max_connections
-                cursor.execute("""
-                    SELECT setting::int
-                    FROM pg_settings 
-                    WHERE name = 'max_connections';
-                """)
-                max_connections = cursor.fetchone()[0]
-
-                # Get shared_buffers and its unit
-                cursor.execute("""
-                    SELECT setting, unit
-                    FROM pg_settings 
-                    WHERE name = 'shared_buffers';
-                """)
-                shared_buffers_value, shared_buffers_unit = cursor.fetchone()
-                shared_buffers_value = int(shared_buffers_value)
-
-                # Convert shared_buffers to MB
-                if shared_buffers_unit == 'kB':
-                    shared_buffers_mb = shared_buffers_value / 1024
-                elif shared_buffers_unit == 'MB':
-                    shared_buffers_mb = shared_buffers_value
-                elif shared_buffers_unit == '8kB':
-                    shared_buffers_mb = (shared_buffers_value * 8) / 1024
-                elif shared_buffers_unit == 'GB':
-                    shared_buffers_mb = shared_buffers_value * 1024
-                else:
-                    shared_buffers_mb = 0
-
-                # Convert system memory to MB
-                system_memory_mb = self.memory_gb * 1024
-                
-                # Calculate possible available memory (25% of what's left after shared_buffers)
-                possible_avail_mb = (system_memory_mb - shared_buffers_mb) * 0.25
-                
-                # Calculate potential memory usage
-                potential_usage_mb = work_mem_mb * max_connections
-                
-                is_failed = potential_usage_mb > possible_avail_mb
-                
-                return [{
-                    "parameter": "work_mem",
-                    "check_result": "FAILED" if is_failed else "PASSED",
-                    "priority": "HIGH",
-                    "notes": (f"Potential usage ({potential_usage_mb:.0f}MB) exceeds 25% limit ({possible_avail_mb:.0f}MB). "
-                            f"Reduce work_mem or connections."
-                            if is_failed else
-                            "Within reasonable limits")
-                }]
-                
-        except psycopg2.Error as e:
-            return [{
-                "parameter": "work_mem",
-                "check_result": "ERROR",
-                "priority": "HIGH",
-                "notes": f"Error checking work_mem parameter: {e}"
-            }]
+            settings = self._load_settings(['work_mem', 'max_connections', 'shared_buffers'])
+
+            work_mem_mb = _to_mb(settings.get_bytes('work_mem'))
+            max_connections = settings['max_connections'][0]
+            shared_buffers_mb = _to_mb(settings.get_bytes('shared_buffers'))
+
+            # Convert system memory to MB
+            system_memory_mb = self.memory_gb * 1024
+            
+            # Calculate possible available memory (25% of what's left after shared_buffers)
+            possible_avail_mb = (system_memory_mb - shared_buffers_mb) * 0.25
+            
+            # Calculate potential memory usage
+            potential_usage_mb = work_mem_mb * max_connections
+            
+            is_failed = potential_usage_mb > possible_avail_mb
+            
+            return [CheckResult(
+                parameter="work_mem",
+                check_result=CheckStatus.FAILED if is_failed else CheckStatus.PASSED,
+                priority=Priority.HIGH,
+                notes=(_WORK_MEM_FAILED_NOTES(used=potential_usage_mb, limit=possible_avail_mb)
+                        if is_failed else
+                        "Within reasonable limits")
+            )]
+            
+        except psycopg.Error as e:
+            return [_check_error("work_mem", e)]
 
     def format_results(self, results, 
                       sort_by_priority=True, 
@@ -509,7 +592,7 @@ class PostgresqlConnection:
             sort_by_priority (bool): Whether to sort results by priority
             show_passed (bool): Whether to show passed checks
             show_skipped (bool): Whether to show skipped checks
-            priorities (list): List of priorities to include (e.g., ['HIGH', 'MEDIUM'])
+            priorities (list): List of priorities to include (e.g., ['HIGH', 'MEDIUM'] or Priority members)
             parameters (list): List of specific parameters to include
             output_format (str): Output format ('grid', 'simple', 'pipe', etc.)
             csv_file (str): Optional path to save results as CSV
@@ -517,44 +600,53 @@ class PostgresqlConnection:
         Returns:
             str: Formatted assessment results
         """
+        from tabulate import tabulate
+
         try:
-            # Convert results to DataFrame
-            df = pd.DataFrame(results)
-            
-            # Filter based on check_result if needed
-            if not show_passed:
-                df = df[df['check_result'] != 'PASSED']
-            if not show_skipped:
-                df = df[df['check_result'] != 'SKIPPED']
-            
-            # Filter by priorities if specified
             if priorities:
-                df = df[df['priority'].isin(priorities)]
+                # Names are matched case-insensitively, unknown names are skipped
+                priorities = {
+                    Priority.__members__.get(priority.upper()) if isinstance(priority, str) else priority
+                    for priority in priorities
+                }
+                priorities.discard(None)
             
-            # Filter by parameters if specified
-            if parameters:
-                df = df[df['parameter'].isin(parameters)]
+            # Filter based on check_result, priorities and parameters in a single pass
+            filtered = [
+                result for result in results
+                if (show_passed or result.check_result is not CheckStatus.PASSED)
+                and (show_skipped or result.check_result is not CheckStatus.SKIPPED)
+                and (not priorities or result.priority in priorities)
+                and (not parameters or result.parameter in parameters)
+            ]
             
-            # Sort by priority if requested
+            # Sort by priority if requested, most urgent first
             if sort_by_priority:
-                priority_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
-                df['priority_sort'] = df['priority'].map(priority_order)
-                df = df.sort_values('priority_sort').drop('priority_sort', axis=1)
+                filtered.sort(key=attrgetter('priority'), reverse=True)
+            
+            # Enums are displayed by name
+            rows = [
+                (result.parameter, result.check_result.name, result.priority.name, result.notes)
+                for result in filtered
+            ]
             
             # Save to CSV if filename provided
             if csv_file:
                 try:
-                    df.to_csv(csv_file, index=False)
+                    with open(csv_file, 'w', newline='') as f:
+                        writer = csv.writer(f)
+                        writer.writerow(_RESULT_FIELDS)
+                        writer.writerows(rows)
                     print(f"Results saved to {csv_file}")
                 except Exception as e:
                     print(f"Error saving to CSV: {str(e)}")
             
             # Return empty string if no results match filters
-            if df.empty:
+            if not rows:
                 return "No results match the specified criteria."
             
             # Format the results
-            return tabulate(df, headers='keys', tablefmt=output_format, showindex=False)
+            return tabulate(rows, headers=_RESULT_FIELDS, tablefmt=output_format)
             
         except Exception as e:
             return f"Error formatting results: {str(e)}"
@@ -570,18 +662,53 @@ class PostgresqlConnection:
         Returns:
             str or list: Formatted results string if format_params provided, otherwise raw results list
         """
-        results = []
-        results.extend(self.check_page_cost_parameters())
-        results.extend(self.check_shared_buffers())
-        results.extend(self.check_max_connections_memory())
-        results.extend(self.check_maintenance_work_mem())
-        results.extend(self.check_work_mem())
+        results = self._run_checks()
         
         # Return formatted results if format parameters provided
         if format_params:
             return self.format_results(results, **format_params)
         return results
 
+    def _run_checks(self):
+        """
+        Runs all parameter checks, reusing the results of the previous run while
+        the system properties are unchanged. Runs that produced an error are not
+        reused.
+        
+        Returns:
+            list: Combined parameter check results
+        """
+        key = (self.cpu_count, self.memory_gb, self.storage_type, self.deployment_type)
+        if self._results_cache is not None and self._results_cache[0] == key:
+            return list(self._results_cache[1])
+
+        # Fetch every setting needed by the checks in a single query. If that
+        # fails, every check reports the same error without fetching again.
+        try:
+            self._load_settings(self.SETTINGS)
+        except psycopg.Error as e:
+            return [_check_error(parameter, e) for parameter in _CHECK_ERROR_NOTES]
+
+        results = tuple(chain(
+            self.check_page_cost_parameters(),
+            self.check_shared_buffers(),
+            self.check_max_connections_memory(),
+            self.check_maintenance_work_mem(),
+            self.check_work_mem()
+        ))
+        if all(result.check_result is not CheckStatus.ERROR for result in results):
+            self._results_cache = (key, results)
+        return list(results)
+
+    def invalidate_results_cache(self):
+        """
+        Discards the memoized parameter check results and the settings they were
+        computed from, so the next check_all_parameters call fetches the settings
+        and runs the checks again.
+        """
+        self._results_cache = None
+        self._settings_cache.evict(self.SETTINGS)
+
 if __name__ == "__main__":
     # Set up argument parser
     parser = argparse.ArgumentParser(description='PostgreSQL Connection Manager')
@@ -592,16 +719,16 @@ if __name__ == "__main__":
                        type=int,
                        help='Memory in GB')
     parser.add_argument('--storage-type',
-                       type=str,
-                       choices=['ssd', 'hdd'],
+                       type=_enum_choice(_STORAGE_CHOICES),
+                       metavar='{' + ','.join(_STORAGE_CHOICES) + '}',
                        help='Storage backend type (ssd or hdd)')
     parser.add_argument('--desired-rto',
                        type=int,
                        help='Desired Recovery Time Objective in minutes')
     
     parser.add_argument('--deployment-type',
-                       type=str,
-                       choices=['onprem', 'rds'],
+                       type=_enum_choice(_DEPLOYMENT_CHOICES),
+                       metavar='{' + ','.join(_DEPLOYMENT_CHOICES) + '}',
                        help='Deployment type (onprem or rds)')
     parser.add_argument('--csv-output',
                        type=str,
@@ -610,56 +737,46 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     try:
-        # Convert storage type string to enum if provided
-        storage_type = None
-        if args.storage_type:
-            storage_type = StorageType(args.storage_type.lower())
-
-        # Convert deployment type string to enum if provided
-        deployment_type = None
-        if args.deployment_type:
-            deployment_type = DeploymentType(args.deployment_type.lower())
-
         # Create PostgreSQL connection instance with provided arguments
         postgresql_instance = PostgresqlConnection(
             cpu_count=args.cpu_count,
             memory_gb=args.memory_gb,
-            storage_type=storage_type,
+            storage_type=args.storage_type,
             desired_rto_in_minutes=args.desired_rto,
-            deployment_type=deployment_type
+            deployment_type=args.deployment_type
         )
         
-        checkpoint_assessment = CheckpointAssessment(postgresql_instance.get_connection(), postgresql_instance.desired_rto_in_minutes)
-        worker_assessment = WorkerAssessment(postgresql_instance.get_connection(), postgresql_instance.cpu_count)
-        observability_assessment = ObservabilityAssessment(postgresql_instance.get_connection())
-        timeouts_assessment = TimeoutsAssessment(postgresql_instance.get_connection())
-        # Get the connection and test it
-        conn = postgresql_instance.get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()
-            
-            # Get all parameter check results
-            all_results = postgresql_instance.check_all_parameters()
-            checkpoint_results = checkpoint_assessment.prepare_checkpoint_stats()
-            worker_results = worker_assessment.prepare_worker_stats()
-            observability_results = observability_assessment.assess_monitoring_settings()
-            all_results.extend(checkpoint_results)
-            all_results.extend(worker_results)
-            all_results.extend(observability_results)
-            all_results.extend(timeouts_assessment.check_idle_timeouts())
-            # Format and display results
-            print(f"PostgreSQL {version[0]}\n")
-            formatted_results = postgresql_instance.format_results(
-                all_results,
-                show_passed=True,
-                sort_by_priority=True,
-                output_format='grid',
-                csv_file=args.csv_output
-            )
-            print(formatted_results)
+        checkpoint_assessment = CheckpointAssessment(postgresql_instance.get_provider(), postgresql_instance.desired_rto_in_minutes)
+        worker_assessment = WorkerAssessment(postgresql_instance.get_provider(), postgresql_instance.cpu_count)
+        observability_assessment = ObservabilityAssessment(postgresql_instance.get_provider())
+        timeouts_assessment = TimeoutsAssessment(postgresql_instance.get_provider())
+        version_assessment = ServerVersionAssessment()
+        # Run the parameter checks and the assessments concurrently on two pooled
+        # connections, matching the pool's min_size; the version query rides in
+        # the assessments' pipeline
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parameter_future = executor.submit(postgresql_instance.check_all_parameters)
+            assessment_future = executor.submit(postgresql_instance.run_assessments, [
+                version_assessment,
+                checkpoint_assessment,
+                worker_assessment,
+                observability_assessment,
+                timeouts_assessment
+            ])
+            all_results = list(chain(parameter_future.result(), assessment_future.result()))
+        # Format and display results
+        if version_assessment.version is not None:
+            print(f"PostgreSQL {version_assessment.version}\n")
+        formatted_results = postgresql_instance.format_results(
+            all_results,
+            show_passed=True,
+            sort_by_priority=True,
+            output_format='grid',
+            csv_file=args.csv_output
+        )
+        print(formatted_results)
         
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         print(f"Database error occurred: {e}")
         sys.exit(1)
     except Exception as e:
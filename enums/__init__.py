@@ -1,2 +1,4 @@
 from .storage_type import StorageType
 from .deployment_type import DeploymentType
+from .check_status import CheckStatus
+from .priority import Priority
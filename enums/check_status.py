@@ -0,0 +1,10 @@
+from enum import IntEnum
+
+class CheckStatus(IntEnum):
+    """
+    Enum for the outcome of a configuration check
+    """
+    PASSED = 0
+    SKIPPED = 1
+    FAILED = 2
+    ERROR = 3
@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+class Priority(IntEnum):
+    """
+    Enum for the priority of a configuration check, higher values are more urgent
+    """
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2